@@ -107,26 +107,11 @@ def _plot_dual_metric(ax, strategies, strategy_stats, colors, metric_names, ylab
     ax_mrr = ax
     ax_latency = ax.twinx()
 
-    for idx, strategy in enumerate(strategies):
-        offsets = x - total_width / 2 + idx * bar_width + bar_width / 2
-
-        ax_mrr.bar(
-            offsets[0],
-            mrr_values[idx],
-            width=bar_width,
-            color=colors[idx],
-            edgecolor="#222222",
-            linewidth=0.75,
-        )
-
-        ax_latency.bar(
-            offsets[1],
-            latency_values[idx],
-            width=bar_width,
-            color=colors[idx],
-            edgecolor="#222222",
-            linewidth=0.75,
-        )
+    # One bar call per metric: strategies are laid out side by side around each tick
+    offsets = np.arange(len(strategies)) * bar_width - total_width / 2 + bar_width / 2
+    bar_style = dict(width=bar_width, color=colors, edgecolor="#222222", linewidth=0.75)
+    ax_mrr.bar(x[0] + offsets, mrr_values, **bar_style)
+    ax_latency.bar(x[1] + offsets, latency_values, **bar_style)
 
     ax_mrr.set_xticks(x)
     ax_mrr.set_xticklabels(ylabels)
@@ -200,7 +185,6 @@ def generate_plot(json_filename: str, output_filename: str) -> None:
         ("MRR (%)", "Latency (ms)"),
     )
 
-    fig.subplots_adjust(top=0.82, left=0.06, right=0.94)
     fig.subplots_adjust(top=0.82, left=0.06, right=0.94)
     fig.legend(
         legend_handles,
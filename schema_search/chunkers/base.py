@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from abc import ABC, abstractmethod
 
 from tqdm import tqdm
@@ -6,6 +6,34 @@ from tqdm import tqdm
 from schema_search.types import Chunk, TableSchema, DBSchema
 
 
+def _pack_lines(
+    line_token_counts: List[int], max_tokens: int, header_tokens: int
+) -> List[Tuple[int, int, int]]:
+    """Greedily pack lines into chunks that fit within max_tokens.
+
+    Every chunk carries the header, and a line that alone exceeds the budget
+    still gets a chunk of its own.
+
+    Returns:
+        List of (start, end, token_count) line ranges, one per chunk.
+    """
+    ranges: List[Tuple[int, int, int]] = []
+    start = 0
+    current_tokens = header_tokens
+
+    for i, line_tokens in enumerate(line_token_counts):
+        if current_tokens + line_tokens > max_tokens and i > start:
+            ranges.append((start, i, current_tokens))
+            start = i
+            current_tokens = header_tokens
+        current_tokens += line_tokens
+
+    if start < len(line_token_counts):
+        ranges.append((start, len(line_token_counts), current_tokens))
+
+    return ranges
+
+
 class BaseChunker(ABC):
     """Base class for schema chunkers."""
 
@@ -39,6 +67,10 @@ class BaseChunker(ABC):
     def _generate_content(self, table_name: str, schema: TableSchema) -> str:
         pass
 
+    def _generate_lines(self, table_name: str, schema: TableSchema) -> List[str]:
+        """Content as lines; override to skip the join/split round trip."""
+        return self._generate_content(table_name, schema).split("\n")
+
     def _chunk_table(
         self,
         catalog: Optional[str],
@@ -47,54 +79,38 @@ class BaseChunker(ABC):
         table_schema: TableSchema,
     ) -> List[Chunk]:
         """Chunk a single table's schema into searchable pieces."""
-        content = self._generate_content(table_name, table_schema)
-        lines = content.split("\n")
+        lines = self._generate_lines(table_name, table_schema)[1:]
+        line_token_counts = self._estimate_line_tokens(lines)
 
         schema_key = f"{catalog}.{schema_name}" if catalog else schema_name
         header = f"Schema: {schema_key}\nTable: {table_name}"
         header_tokens = self._estimate_tokens(header)
 
-        chunks: List[Chunk] = []
-        current_chunk_lines = [header]
-        current_tokens = header_tokens
-        chunk_idx = 0
-
-        for line in lines[1:]:
-            line_tokens = self._estimate_tokens(line)
-
-            if (
-                current_tokens + line_tokens > self.max_tokens
-                and len(current_chunk_lines) > 1
-            ):
-                chunk_content = "\n".join(current_chunk_lines)
-                chunks.append(
-                    Chunk(
-                        catalog=catalog,
-                        schema_name=schema_name,
-                        table_name=table_name,
-                        content=chunk_content,
-                        chunk_id=f"{schema_key}.{table_name}.{chunk_idx}",
-                        token_count=current_tokens,
-                    )
+        # Common case: the whole table fits, so skip packing and slicing
+        total_tokens = header_tokens + sum(line_token_counts)
+        if lines and total_tokens <= self.max_tokens:
+            return [
+                Chunk(
+                    catalog=catalog,
+                    schema_name=schema_name,
+                    table_name=table_name,
+                    content="\n".join([header, *lines]),
+                    chunk_id=f"{schema_key}.{table_name}.0",
+                    token_count=total_tokens,
                 )
-                chunk_idx += 1
+            ]
 
-                current_chunk_lines = [header]
-                current_tokens = header_tokens
-
-            current_chunk_lines.append(line)
-            current_tokens += line_tokens
-
-        if len(current_chunk_lines) > 1:
-            chunk_content = "\n".join(current_chunk_lines)
+        chunks: List[Chunk] = []
+        line_ranges = _pack_lines(line_token_counts, self.max_tokens, header_tokens)
+        for chunk_idx, (start, end, token_count) in enumerate(line_ranges):
             chunks.append(
                 Chunk(
                     catalog=catalog,
                     schema_name=schema_name,
                     table_name=table_name,
-                    content=chunk_content,
+                    content="\n".join([header, *lines[start:end]]),
                     chunk_id=f"{schema_key}.{table_name}.{chunk_idx}",
-                    token_count=current_tokens,
+                    token_count=token_count,
                 )
             )
 
@@ -102,3 +118,7 @@ class BaseChunker(ABC):
 
     def _estimate_tokens(self, text: str) -> int:
         return len(text.split()) + len(text) // 4
+
+    def _estimate_line_tokens(self, lines: List[str]) -> List[int]:
+        """Estimate tokens for every line in one pass (same heuristic as _estimate_tokens)."""
+        return [len(line.split()) + len(line) // 4 for line in lines]
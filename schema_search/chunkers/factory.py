@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Dict, Optional
 
 from schema_search.chunkers.base import BaseChunker
@@ -6,7 +7,10 @@ from schema_search.chunkers.llm import LLMChunker
 
 
 def create_chunker(
-    config: Dict, llm_api_key: Optional[str], llm_base_url: Optional[str]
+    config: Dict,
+    llm_api_key: Optional[str],
+    llm_base_url: Optional[str],
+    cache_dir: Optional[Path] = None,
 ) -> BaseChunker:
     chunking_config = config["chunking"]
     strategy = chunking_config["strategy"]
@@ -20,6 +24,8 @@ def create_chunker(
             llm_api_key=llm_api_key,
             llm_base_url=llm_base_url,
             show_progress=show_progress,
+            max_concurrency=chunking_config.get("max_concurrency", 8),
+            cache_dir=cache_dir,
         )
     elif strategy == "raw":
         return MarkdownChunker(
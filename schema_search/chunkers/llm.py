@@ -1,9 +1,16 @@
+import hashlib
 import json
 import logging
-from typing import Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import orjson
+from tqdm import tqdm
 
 from schema_search.chunkers.base import BaseChunker
-from schema_search.types import TableSchema
+from schema_search.types import Chunk, DBSchema, TableSchema
+from schema_search.utils.cache import load_summaries, save_summaries
 from schema_search.utils.utils import lazy_import_check
 
 if TYPE_CHECKING:
@@ -21,14 +28,86 @@ class LLMChunker(BaseChunker):
         llm_api_key: Optional[str],
         llm_base_url: Optional[str],
         show_progress: bool = False,
+        max_concurrency: int = 8,
+        cache_dir: Optional[Path] = None,
     ):
         super().__init__(max_tokens, overlap_tokens, show_progress)
         self.model = model
+        self.max_concurrency = max_concurrency
+        self.cache_dir = cache_dir
         openai = lazy_import_check("openai", "llm", "LLM-based chunking")
         self.llm_client: "OpenAI" = openai.OpenAI(api_key=llm_api_key, base_url=llm_base_url)
+        self._summaries: Dict[Tuple[str, str], str] = {}
         logger.info(f"Schema Summarizer Model: {self.model}")
 
+    def chunk_schemas(self, schemas: DBSchema) -> List[Chunk]:
+        """Summarize all tables concurrently, then chunk the summaries."""
+        tables = [
+            (schema_key, table_name, table_schema)
+            for schema_key, schema_tables in schemas.items()
+            for table_name, table_schema in schema_tables.items()
+        ]
+
+        cached = load_summaries(self.cache_dir) if self.cache_dir else {}
+        keys = [self._summary_key(table_schema) for _, _, table_schema in tables]
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        logger.info(
+            f"Summarizing {len(missing)} tables ({len(tables) - len(missing)} cached)"
+        )
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = {
+                    executor.submit(self._summarize, tables[i][1], tables[i][2]): i
+                    for i in missing
+                }
+                completed = as_completed(futures)
+                if self.show_progress:
+                    completed = tqdm(
+                        completed,
+                        total=len(missing),
+                        desc="Summarizing tables",
+                        unit="table",
+                    )
+                # Submitted calls run to completion regardless, so keep their
+                # results and re-raise the first failure afterwards
+                first_error: Optional[BaseException] = None
+                for future in completed:
+                    error = future.exception()
+                    if error is None:
+                        cached[keys[futures[future]]] = future.result()
+                    elif first_error is None:
+                        first_error = error
+            if first_error is not None:
+                raise first_error
+        finally:
+            # Keep every summary paid for so far, even if another call failed;
+            # entries for other models and tables stay in the cache too
+            if self.cache_dir:
+                save_summaries(self.cache_dir, cached)
+
+        self._summaries = {
+            (schema_key, table_name): cached[key]
+            for (schema_key, table_name, _), key in zip(tables, keys)
+        }
+
+        try:
+            return super().chunk_schemas(schemas)
+        finally:
+            self._summaries = {}
+
     def _generate_content(self, table_name: str, schema: TableSchema) -> str:
+        summary = self._summaries.get((schema["schema"], table_name))
+        if summary is None:
+            summary = self._summarize(table_name, schema)
+        return f"Table: {table_name}\n{summary}"
+
+    def _summary_key(self, schema: TableSchema) -> str:
+        """Cache key for a table summary: the model plus the canonical schema JSON."""
+        payload = self.model.encode() + orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _summarize(self, table_name: str, schema: TableSchema) -> str:
         prompt = f"""Generate a concise 250 tokens or less semantic summary of this database table schema. Focus on:
 1. What entity or concept this table represents
 2. Key data it stores (main columns)
@@ -51,4 +130,4 @@ Return ONLY the summary text, no preamble."""
         summary = response.choices[0].message.content.strip()  # type: ignore
         logger.debug(f"Generated LLM summary for {table_name}: {summary[:100]}...")
 
-        return f"Table: {table_name}\n{summary}"
+        return summary
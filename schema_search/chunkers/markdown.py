@@ -1,9 +1,14 @@
+from typing import List
+
 from schema_search.chunkers.base import BaseChunker
 from schema_search.types import TableSchema
 
 
 class MarkdownChunker(BaseChunker):
     def _generate_content(self, table_name: str, schema: TableSchema) -> str:
+        return "\n".join(self._generate_lines(table_name, schema))
+
+    def _generate_lines(self, table_name: str, schema: TableSchema) -> List[str]:
         lines = [f"Table: {table_name}"]
 
         if schema["primary_keys"]:
@@ -22,4 +27,4 @@ class MarkdownChunker(BaseChunker):
             if idx_names:
                 lines.append(f"Indexes: {', '.join(idx_names)}")
 
-        return "\n".join(lines)
+        return lines
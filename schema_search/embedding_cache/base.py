@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
+from schema_search.utils.utils import top_k_indices
 from schema_search.types import Chunk
 
 
@@ -24,6 +25,7 @@ class BaseEmbeddingCache(ABC):
         self.batch_size = batch_size
         self.show_progress = show_progress
         self.embeddings = None
+        self.chunks: Optional[List[Chunk]] = None
 
     @abstractmethod
     def load_or_generate(
@@ -38,3 +40,14 @@ class BaseEmbeddingCache(ABC):
     @abstractmethod
     def compute_similarities(self, query_embedding: np.ndarray) -> np.ndarray:
         pass
+
+    def close(self) -> None:
+        """Release background resources; the default cache holds none."""
+
+    def compute_top_k(
+        self, query_embedding: np.ndarray, k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Indices and scores of the k most similar chunks, best first."""
+        scores = self.compute_similarities(query_embedding)
+        top_indices = top_k_indices(scores, k)
+        return top_indices, scores[top_indices]
@@ -0,0 +1,102 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+
+# Queued by close() to stop the worker once it has drained earlier queries
+_STOP: Any = object()
+
+
+class QueryBatcher:
+    """Coalesces concurrent single-query encodes into one batched encode call.
+
+    Callers block in `encode` while a background worker collects queries for up
+    to `window_sec` (or until `max_batch` are queued), encodes them together,
+    and hands each caller its own row. `close` stops the worker.
+    """
+
+    def __init__(
+        self,
+        encode_batch: Callable[[List[str]], np.ndarray],
+        window_sec: float,
+        max_batch: int,
+    ):
+        self.encode_batch = encode_batch
+        self.window_sec = window_sec
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def encode(self, query: str) -> np.ndarray:
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("QueryBatcher is closed")
+            self._queue.put((query, future))
+            self._ensure_worker()
+        return future.result()
+
+    def close(self) -> None:
+        """Stop the worker after it answers the queries already queued."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+            if worker is not None:
+                self._queue.put(_STOP)
+        if worker is not None:
+            worker.join()
+
+    def _ensure_worker(self) -> None:
+        # Caller holds self._lock
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name="schema-search-query-batcher", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.window_sec
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._encode(batch)
+
+    def _encode(self, batch: List[Tuple[str, Future]]) -> None:
+        # Every future must be settled here, or its caller blocks forever
+        try:
+            embeddings = self.encode_batch([query for query, _ in batch])
+            if len(embeddings) != len(batch):
+                raise RuntimeError(
+                    f"Encoder returned {len(embeddings)} embeddings "
+                    f"for {len(batch)} queries"
+                )
+        except BaseException as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings):
+            future.set_result(np.asarray(embedding, dtype=np.float32))
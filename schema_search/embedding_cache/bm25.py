@@ -1,13 +1,18 @@
-from typing import List
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, TYPE_CHECKING
+import hashlib
 import re
 import logging
 import numpy as np
-
-import bm25s
+import orjson
 
 from schema_search.types import Chunk
 
-logging.getLogger("bm25s").setLevel(logging.WARNING)
+if TYPE_CHECKING:
+    import bm25s
+
+logger = logging.getLogger(__name__)
 
 
 def light_stem(token: str) -> str:
@@ -20,45 +25,103 @@ def light_stem(token: str) -> str:
     return token
 
 
+# Runs of letters or digits. Equivalent to splitting on "_"/"-" and at
+# letter/digit boundaries, then keeping alphanumeric runs, in one C-level pass.
+_TOKEN_RE = re.compile(r"[a-z]+|[0-9]+")
+
+
+@lru_cache(maxsize=65536)
+def _normalize_token(t: str) -> str:
+    """Canonicalize one raw token; schema vocabularies repeat, so memoize."""
+    if t in {"pk", "pkey", "key"}:
+        t = "id"
+    elif t in {"ts", "time", "timestamp"}:
+        t = "timestamp"
+    elif t.endswith("id") and len(t) > 2:
+        t = "id"
+    elif t in {"ix", "index", "idx"}:
+        t = "index"
+    return light_stem(t)
+
+
+# Part of the persisted index digest. Bump on any change to _TOKEN_RE,
+# _normalize_token or light_stem so indexes built with old tokens are rebuilt.
+_TOKENIZER_VERSION = "1"
+
+
 def _tokenize(text: str) -> List[str]:
     """Tokenize and normalize database-like text."""
-    text = text.lower()
-    text = text.replace("\n", " ")
-    text = re.sub(r"[_\-]+", " ", text)
-    text = re.sub(r"([a-z])([A-Z])", r"\1 \2", text)
-    text = re.sub(r"([a-z])([0-9])", r"\1 \2", text)
-    text = re.sub(r"([0-9])([a-z])", r"\1 \2", text)
-
-    tokens = re.findall(r"[a-z0-9]+", text)
-    normalized = []
-    for t in tokens:
-        if t in {"pk", "pkey", "key"}:
-            t = "id"
-        elif t in {"ts", "time", "timestamp"}:
-            t = "timestamp"
-        elif t.endswith("id") and len(t) > 2:
-            t = "id"
-        elif t in {"ix", "index", "idx"}:
-            t = "index"
-        normalized.append(light_stem(t))
-    return normalized
+    return [_normalize_token(t) for t in _TOKEN_RE.findall(text.lower())]
+
+
+def _corpus_digest(chunks: List[Chunk]) -> str:
+    """Digest of the tokenizer and every chunk's content; identifies a built index."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{_TOKENIZER_VERSION}:{_TOKEN_RE.pattern}".encode())
+    digest.update(b"\0")
+    for chunk in chunks:
+        digest.update(chunk.content.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
 
 
 class BM25Cache:
-    def __init__(self):
-        self.bm25 = None
-        self.tokenized_docs = None
+    def __init__(self, cache_dir: Path, backend: str = "numpy"):
+        self.index_dir = cache_dir / "bm25"
+        # "numba" JIT-compiles bm25s' kernels per index: seconds per build for
+        # microseconds per query, so only worth it on very large corpora
+        self.backend = backend
+        self.bm25: Optional["bm25s.BM25"] = None
+        self.chunks: Optional[List[Chunk]] = None
 
-    def build(self, chunks: List[Chunk]) -> None:
+    def build(self, chunks: List[Chunk], force: bool = False) -> None:
         if not chunks:
             raise ValueError("Cannot build BM25 index on empty chunk list")
-        if self.bm25 is None:
-            self.tokenized_docs = [_tokenize(chunk.content) for chunk in chunks]
-            self.bm25 = bm25s.BM25()
-            self.bm25.index(self.tokenized_docs)
+
+        # Deferred: bm25s pulls in scipy.sparse, which fuzzy/semantic never need
+        import bm25s
+
+        # bm25s sets its own logger level on import, so quiet it afterwards
+        logging.getLogger("bm25s").setLevel(logging.WARNING)
+
+        digest = _corpus_digest(chunks)
+        if not force and self._load(bm25s, digest):
+            self.chunks = chunks
+            return
+
+        tokenized_docs = [_tokenize(chunk.content) for chunk in chunks]
+        self.bm25 = bm25s.BM25(backend=self.backend)
+        self.bm25.index(tokenized_docs)
+        self.chunks = chunks
+        self._save(digest)
+
+    def _load(self, bm25s, digest: str) -> bool:
+        """Load the persisted index if it was built from the same chunks."""
+        config_file = self.index_dir / "cache_config.json"
+        if not config_file.exists():
+            return False
+        try:
+            if orjson.loads(config_file.read_bytes())["corpus_digest"] != digest:
+                return False
+            self.bm25 = bm25s.BM25.load(
+                str(self.index_dir), show_progress=False, backend=self.backend
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load BM25 index cache: {e}")
+            return False
+        logger.info("Loaded BM25 index from cache")
+        return True
+
+    def _save(self, digest: str) -> None:
+        assert self.bm25 is not None
+        config_file = self.index_dir / "cache_config.json"
+        # Drop the marker first so a partial write is never taken as valid
+        config_file.unlink(missing_ok=True)
+        self.bm25.save(str(self.index_dir), show_progress=False)
+        config_file.write_bytes(orjson.dumps({"corpus_digest": digest}))
 
     def get_scores(self, query: str) -> np.ndarray:
-        if self.bm25 is None or self.tokenized_docs is None:
+        if self.bm25 is None:
             raise RuntimeError("BM25 cache not built. Call build() first.")
         query_tokens = _tokenize(query)
         scores = self.bm25.get_scores(query_tokens)
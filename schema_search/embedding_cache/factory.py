@@ -15,6 +15,8 @@ def create_embedding_cache(config: Dict, cache_dir: Path) -> BaseEmbeddingCache:
             metric=config["embedding"]["metric"],
             batch_size=config["embedding"]["batch_size"],
             show_progress=config["embedding"]["show_progress"],
+            ann=config["embedding"].get("ann", False),
+            query_batch_window_ms=config["embedding"].get("query_batch_window_ms", 0),
         )
     else:
         raise ValueError(f"Unsupported embedding location: {location}")
@@ -1,20 +1,47 @@
-import json
+import hashlib
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
+import orjson
 
 from schema_search.types import Chunk
 from schema_search.embedding_cache.base import BaseEmbeddingCache
+from schema_search.embedding_cache.batching import QueryBatcher
 from schema_search.metrics import get_metric
+from schema_search.utils.cache import write_atomic
 from schema_search.utils.utils import lazy_import_check
 
 if TYPE_CHECKING:
+    import faiss
     from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
+_HNSW_M = 32  # graph degree: recall vs. index size
+_HNSW_EF_SEARCH = 128  # candidate beam per query: recall vs. latency
+
+
+def _content_hashes(chunks: List[Chunk]) -> np.ndarray:
+    """64-bit hash of each chunk's content, used to key cached embedding rows."""
+    return np.array(
+        [
+            int.from_bytes(
+                hashlib.blake2b(chunk.content.encode(), digest_size=8).digest(), "little"
+            )
+            for chunk in chunks
+        ],
+        dtype=np.uint64,
+    )
+
+
+def _normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize rows in place (restores unit length after the fp16 round trip)."""
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True).clip(1e-12)
+    return embeddings
+
 
 class InMemoryEmbeddingCache(BaseEmbeddingCache):
     def __init__(
@@ -24,33 +51,100 @@ class InMemoryEmbeddingCache(BaseEmbeddingCache):
         metric: str,
         batch_size: int,
         show_progress: bool,
+        ann: bool = False,
+        query_batch_window_ms: float = 0,
     ):
         super().__init__(cache_dir, model_name, metric, batch_size, show_progress)
         self.model: Optional["SentenceTransformer"] = None
+        # Concurrent searches share one forward pass; off by default since a
+        # lone query would wait out the window
+        self.query_batcher: Optional[QueryBatcher] = None
+        if query_batch_window_ms > 0:
+            self.query_batcher = QueryBatcher(
+                self._encode_queries, query_batch_window_ms / 1000, batch_size
+            )
+        self.ann = ann
+        self.ann_index: Optional["faiss.Index"] = None
+        if ann and metric not in ("cosine", "dot"):
+            logger.warning(
+                f"ANN index needs cosine or dot metric, not {metric}; "
+                "using exact search"
+            )
+            self.ann = False
 
     def load_or_generate(
         self, chunks: List[Chunk], force: bool, chunking_config: Dict
     ) -> None:
-        cache_file = self.cache_dir / "embeddings.npz"
+        cache_file = self.cache_dir / "embeddings.npy"
+        hashes_file = self.cache_dir / "embedding_hashes.npy"
         config_file = self.cache_dir / "cache_config.json"
+        hashes = _content_hashes(chunks)
 
-        if not force and self._is_cache_valid(cache_file, config_file, chunking_config):
+        cached = not force and self._is_cache_valid(
+            cache_file, hashes_file, config_file, chunking_config, hashes
+        )
+        if cached:
             self._load_from_cache(cache_file)
         else:
-            self._generate_and_cache(chunks, cache_file, config_file, chunking_config)
+            self._generate_and_cache(
+                chunks,
+                hashes,
+                cache_file,
+                hashes_file,
+                config_file,
+                chunking_config,
+                force,
+            )
+
+        if self.ann:
+            self._load_or_build_ann_index(self.cache_dir / "hnsw.index", reuse=cached)
+        self.chunks = chunks
+
+    def _load_or_build_ann_index(self, index_file: Path, reuse: bool) -> None:
+        faiss = lazy_import_check("faiss", "ann", "approximate nearest neighbour search")
+        assert self.embeddings is not None
+
+        if reuse and index_file.exists():
+            try:
+                index = faiss.read_index(str(index_file))
+            except Exception as e:
+                logger.warning(f"Failed to load HNSW index, rebuilding: {e}")
+                index = None
+            if index is not None and index.ntotal == len(self.embeddings):
+                logger.info("Loaded HNSW index from cache")
+                self.ann_index = index
+                return
+
+        logger.info(f"Building HNSW index over {len(self.embeddings)} embeddings")
+        index = faiss.IndexHNSWFlat(
+            self.embeddings.shape[1], _HNSW_M, faiss.METRIC_INNER_PRODUCT
+        )
+        index.add(self.embeddings)
+        # faiss only writes to a path, so do the temp-and-rename by hand
+        tmp_file = index_file.with_name(index_file.name + ".tmp")
+        faiss.write_index(index, str(tmp_file))
+        os.replace(tmp_file, index_file)
+        self.ann_index = index
 
     def _load_from_cache(self, cache_file: Path) -> None:
-        logger.info("Loading embeddings from cache")
-        self.embeddings = np.load(cache_file)["embeddings"]
+        # Upcast straight from the mapped file; no decompression or fp16 heap copy
+        self.embeddings = _normalize_rows(
+            np.load(cache_file, mmap_mode="r").astype(np.float32)
+        )
+        logger.info(f"Loaded {len(self.embeddings)} embeddings from cache")
 
     def _is_cache_valid(
-        self, cache_file: Path, config_file: Path, chunking_config: Dict
+        self,
+        cache_file: Path,
+        hashes_file: Path,
+        config_file: Path,
+        chunking_config: Dict,
+        hashes: np.ndarray,
     ) -> bool:
-        if not (cache_file.exists() and config_file.exists()):
+        if not (cache_file.exists() and hashes_file.exists() and config_file.exists()):
             return False
 
-        with open(config_file) as f:
-            cached_config = json.load(f)
+        cached_config = orjson.loads(config_file.read_bytes())
 
         current_config = {
             "strategy": chunking_config["strategy"],
@@ -62,37 +156,95 @@ class InMemoryEmbeddingCache(BaseEmbeddingCache):
             logger.info("Cache invalidated: chunking config changed")
             return False
 
+        if not np.array_equal(np.load(hashes_file), hashes):
+            logger.info("Cache invalidated: chunk contents changed")
+            return False
+
         return True
 
+    def _load_reusable_rows(
+        self, cache_file: Path, hashes_file: Path, config_file: Path
+    ) -> Dict[int, np.ndarray]:
+        """Map content hash -> cached embedding row, if produced by the same model."""
+        if not (cache_file.exists() and hashes_file.exists() and config_file.exists()):
+            return {}
+
+        cached_config = orjson.loads(config_file.read_bytes())
+        if cached_config.get("embedding_model") != self.model_name:
+            return {}
+
+        cached_hashes = np.load(hashes_file)
+        cached_embeddings = np.load(cache_file)
+        if len(cached_hashes) != len(cached_embeddings):
+            return {}
+
+        return {
+            h: cached_embeddings[i] for i, h in enumerate(cached_hashes.tolist())
+        }
+
     def _generate_and_cache(
         self,
         chunks: List[Chunk],
+        hashes: np.ndarray,
         cache_file: Path,
+        hashes_file: Path,
         config_file: Path,
         chunking_config: Dict,
+        force: bool,
     ) -> None:
-        self._load_model()
-
-        logger.info(f"Generating embeddings for {len(chunks)} chunks")
-        texts = [chunk.content for chunk in chunks]
+        # A forced rebuild re-embeds everything: cached rows may be stale
+        reusable = (
+            {}
+            if force
+            else self._load_reusable_rows(cache_file, hashes_file, config_file)
+        )
+        hash_list = hashes.tolist()
+        missing = [i for i, h in enumerate(hash_list) if h not in reusable]
 
-        assert self.model is not None
-        self.embeddings = self.model.encode(
-            texts,
-            batch_size=self.batch_size,
-            normalize_embeddings=True,
-            show_progress_bar=self.show_progress,
+        logger.info(
+            f"Generating embeddings for {len(missing)} chunks "
+            f"({len(chunks) - len(missing)} reused from cache)"
         )
 
-        np.savez_compressed(cache_file, embeddings=self.embeddings)
+        new_embeddings = None
+        if missing:
+            self._load_model()
+            assert self.model is not None
+            new_embeddings = self.model.encode(
+                [chunks[i].content for i in missing],
+                batch_size=self.batch_size,
+                normalize_embeddings=True,
+                show_progress_bar=self.show_progress,
+            )
+            dim = new_embeddings.shape[1]
+        else:
+            dim = len(next(iter(reusable.values())))
+
+        self.embeddings = np.empty((len(chunks), dim), dtype=np.float32)
+        for i, h in enumerate(hash_list):
+            if h in reusable:
+                self.embeddings[i] = reusable[h]
+        if new_embeddings is not None:
+            self.embeddings[missing] = new_embeddings
+        _normalize_rows(self.embeddings)
+
+        # The config marker goes first and comes back last, so a crash between
+        # writes leaves no marker and the files are never paired up wrongly.
+        # The HNSW index goes too: it indexes the old rows, even if ann is off now
+        config_file.unlink(missing_ok=True)
+        (self.cache_dir / "hnsw.index").unlink(missing_ok=True)
+
+        # Normalized vectors lose nothing meaningful in fp16; halves the cache size
+        embeddings_fp16 = self.embeddings.astype(np.float16)
+        write_atomic(cache_file, lambda f: np.save(f, embeddings_fp16))
+        write_atomic(hashes_file, lambda f: np.save(f, hashes))
 
         cache_config = {
             "strategy": chunking_config["strategy"],
             "max_tokens": chunking_config["max_tokens"],
             "embedding_model": self.model_name,
         }
-        with open(config_file, "w") as f:
-            json.dump(cache_config, f, indent=2)
+        write_atomic(config_file, lambda f: f.write(orjson.dumps(cache_config)))
 
     def _load_model(self) -> None:
         if self.model is None:
@@ -103,20 +255,44 @@ class InMemoryEmbeddingCache(BaseEmbeddingCache):
             )
             logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
             self.model = sentence_transformers.SentenceTransformer(self.model_name)
+            if self.model.device.type == "cuda":
+                self.model.half()
             logger.info(f"Loaded embedding model: {self.model_name}")
 
     def encode_query(self, query: str) -> np.ndarray:
         self._load_model()
 
+        if self.query_batcher is not None:
+            return self.query_batcher.encode(query)
+        return np.asarray(self._encode_queries([query])[0], dtype=np.float32)
+
+    def close(self) -> None:
+        if self.query_batcher is not None:
+            self.query_batcher.close()
+
+    def _encode_queries(self, queries: List[str]) -> np.ndarray:
         assert self.model is not None
-        query_emb = self.model.encode(
-            [query],
+        return self.model.encode(
+            queries,
             batch_size=self.batch_size,
             normalize_embeddings=True,
         )
 
-        return query_emb
+    def compute_top_k(
+        self, query_embedding: np.ndarray, k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if self.ann_index is None:
+            return super().compute_top_k(query_embedding, k)
+
+        # Unit-length rows, so inner product is cosine; widen the beam for large k
+        self.ann_index.hnsw.efSearch = max(_HNSW_EF_SEARCH, k)
+        scores, indices = self.ann_index.search(query_embedding[None, :], k)
+        found = indices[0] >= 0
+        return indices[0][found], scores[0][found]
 
     def compute_similarities(self, query_embedding: np.ndarray) -> np.ndarray:
+        if self.metric in ("cosine", "dot"):
+            # Rows and queries are both unit-length, so either is a single GEMV
+            return self.embeddings @ query_embedding
         metric_fn = get_metric(self.metric)
-        return metric_fn(self.embeddings, query_embedding).flatten()
+        return metric_fn(self.embeddings, query_embedding).ravel()
@@ -64,3 +64,6 @@ class BaseExtractor(ABC):
 
     def _include_constraints(self) -> bool:
         return self.config["schema"]["include_constraints"]
+
+    def _max_concurrency(self) -> int:
+        return self.config["schema"].get("max_concurrency", 8)
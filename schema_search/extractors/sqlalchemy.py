@@ -1,7 +1,10 @@
 """SQLAlchemy-based schema extractor for PostgreSQL, MySQL, Snowflake, BigQuery."""
 
-from typing import Dict, List, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 from sqlalchemy import inspect
+from sqlalchemy.engine.default import DefaultDialect
 
 from schema_search.extractors.base import BaseExtractor
 from schema_search.types import (
@@ -22,61 +25,177 @@ class SQLAlchemyExtractor(BaseExtractor):
         inspector = inspect(self.engine)
         result: DBSchema = {}
 
+        bulk = self._has_bulk_reflection()
+
         for schema_name in inspector.get_schema_names():
             if self._should_skip_schema(schema_name):
                 continue
 
-            result[schema_name] = {}
-            for table_name in inspector.get_table_names(schema=schema_name):
-                result[schema_name][table_name] = self._extract_table(
-                    inspector, table_name, schema_name
+            table_names = inspector.get_table_names(schema=schema_name)
+            if bulk:
+                result[schema_name] = self._extract_schema(
+                    inspector, table_names, schema_name
+                )
+            else:
+                result[schema_name] = self._extract_tables(
+                    inspector, table_names, schema_name
                 )
 
         return result
 
+    def _has_bulk_reflection(self) -> bool:
+        """Whether the dialect reflects a whole schema in one query per object type.
+
+        SQLAlchemy 2.0 added Inspector.get_multi_*; dialects that don't override
+        them (MySQL, SQLite, most third-party ones) just loop per table inside.
+        """
+        default_impl = getattr(DefaultDialect, "get_multi_columns", None)
+        dialect_impl = getattr(type(self.engine.dialect), "get_multi_columns", None)
+        return default_impl is not None and dialect_impl is not default_impl
+
+    def _extract_tables(
+        self, inspector, table_names: List[str], schema_name: str
+    ) -> Dict[str, TableSchema]:
+        max_workers = self._max_concurrency()
+        if (
+            max_workers <= 1
+            or len(table_names) <= 1
+            or self.engine.dialect.name == "sqlite"
+        ):
+            return {
+                table_name: self._extract_table(inspector, table_name, schema_name)
+                for table_name in table_names
+            }
+
+        # Reflection is network-bound; overlap round trips across pooled
+        # connections. Inspectors cache per instance, so one per worker thread.
+        local = threading.local()
+
+        def extract_one(table_name: str) -> TableSchema:
+            if not hasattr(local, "inspector"):
+                local.inspector = inspect(self.engine)
+            return self._extract_table(local.inspector, table_name, schema_name)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(table_names, executor.map(extract_one, table_names)))
+
+    def _extract_schema(
+        self, inspector, table_names: List[str], schema_name: str
+    ) -> Dict[str, TableSchema]:
+        pk_constraints = inspector.get_multi_pk_constraint(schema=schema_name)
+        columns = (
+            inspector.get_multi_columns(schema=schema_name)
+            if self._include_columns()
+            else None
+        )
+        foreign_keys = (
+            inspector.get_multi_foreign_keys(schema=schema_name)
+            if self._include_foreign_keys()
+            else None
+        )
+        indices = (
+            inspector.get_multi_indexes(schema=schema_name)
+            if self._include_indices()
+            else None
+        )
+        unique_constraints = (
+            inspector.get_multi_unique_constraints(schema=schema_name)
+            if self._include_constraints()
+            else None
+        )
+        check_constraints = (
+            inspector.get_multi_check_constraints(schema=schema_name)
+            if self._include_constraints()
+            else None
+        )
+
+        def lookup(reflected, table_name):
+            if reflected is None:
+                return None
+            return reflected.get((schema_name, table_name), [])
+
+        return {
+            table_name: self._build_table(
+                table_name,
+                schema_name,
+                pk_constraints.get((schema_name, table_name), {}),
+                lookup(columns, table_name),
+                lookup(foreign_keys, table_name),
+                lookup(indices, table_name),
+                lookup(unique_constraints, table_name),
+                lookup(check_constraints, table_name),
+            )
+            for table_name in table_names
+        }
+
     def _extract_table(
         self, inspector, table_name: str, schema_name: str
     ) -> TableSchema:
-        pk_constraint = inspector.get_pk_constraint(table_name, schema=schema_name)
+        return self._build_table(
+            table_name,
+            schema_name,
+            inspector.get_pk_constraint(table_name, schema=schema_name),
+            (
+                inspector.get_columns(table_name, schema=schema_name)
+                if self._include_columns()
+                else None
+            ),
+            (
+                inspector.get_foreign_keys(table_name, schema=schema_name)
+                if self._include_foreign_keys()
+                else None
+            ),
+            (
+                inspector.get_indexes(table_name, schema=schema_name)
+                if self._include_indices()
+                else None
+            ),
+            (
+                inspector.get_unique_constraints(table_name, schema=schema_name)
+                if self._include_constraints()
+                else None
+            ),
+            (
+                inspector.get_check_constraints(table_name, schema=schema_name)
+                if self._include_constraints()
+                else None
+            ),
+        )
 
+    def _build_table(
+        self,
+        table_name: str,
+        schema_name: str,
+        pk_constraint: Dict[str, Any],
+        columns: Optional[List[Dict[str, Any]]],
+        foreign_keys: Optional[List[Dict[str, Any]]],
+        indices: Optional[List[Dict[str, Any]]],
+        unique_constraints: Optional[List[Dict[str, Any]]],
+        check_constraints: Optional[List[Dict[str, Any]]],
+    ) -> TableSchema:
         return {
             "name": table_name,
             "schema": schema_name,
-            "primary_keys": pk_constraint["constrained_columns"],
+            "primary_keys": pk_constraint.get("constrained_columns") or [],
             "columns": (
-                self._extract_columns(
-                    inspector.get_columns(table_name, schema=schema_name)
-                )
-                if self._include_columns()
-                else None
+                self._extract_columns(columns) if columns is not None else None
             ),
             "foreign_keys": (
-                self._extract_foreign_keys(
-                    inspector.get_foreign_keys(table_name, schema=schema_name),
-                    schema_name,
-                )
-                if self._include_foreign_keys()
+                self._extract_foreign_keys(foreign_keys, schema_name)
+                if foreign_keys is not None
                 else None
             ),
             "indices": (
-                self._extract_indices(
-                    inspector.get_indexes(table_name, schema=schema_name)
-                )
-                if self._include_indices()
-                else None
+                self._extract_indices(indices) if indices is not None else None
             ),
             "unique_constraints": (
-                self._extract_constraints(
-                    inspector.get_unique_constraints(table_name, schema=schema_name)
-                )
-                if self._include_constraints()
+                self._extract_constraints(unique_constraints)
+                if unique_constraints is not None
                 else None
             ),
             "check_constraints": (
-                self._extract_check_constraints(
-                    inspector.get_check_constraints(table_name, schema=schema_name)
-                )
-                if self._include_constraints()
+                self._extract_check_constraints(check_constraints)
+                if check_constraints is not None
                 else None
             ),
         }
@@ -1,9 +1,9 @@
 import logging
-import pickle
 from pathlib import Path
-from typing import Set
+from typing import Dict, FrozenSet, Set, Tuple
 
 import networkx as nx
+import orjson
 
 from schema_search.types import DBSchema
 
@@ -19,9 +19,11 @@ class GraphBuilder:
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(exist_ok=True)
         self.graph: nx.DiGraph = nx.DiGraph()
+        self._neighbor_cache: Dict[Tuple[str, int], FrozenSet[str]] = {}
 
     def build(self, schemas: DBSchema, force: bool) -> None:
-        cache_file = self.cache_dir / "graph.pkl"
+        cache_file = self.cache_dir / "graph.json"
+        self._neighbor_cache = {}
 
         if not force and cache_file.exists():
             if not self._load_from_cache(cache_file):
@@ -33,8 +35,14 @@ class GraphBuilder:
         """Load graph from cache. Returns True on success, False on failure."""
         logger.debug(f"Loading graph from cache: {cache_file}")
         try:
-            with open(cache_file, "rb") as f:
-                self.graph = pickle.load(f)
+            data = orjson.loads(cache_file.read_bytes())
+            nodes = data["nodes"]
+            graph = nx.DiGraph()
+            graph.add_nodes_from(nodes)
+            graph.add_edges_from(
+                (nodes[source], nodes[target]) for source, target in data["edges"]
+            )
+            self.graph = graph
             return True
         except Exception as e:
             logger.warning(f"Failed to load graph cache: {e}")
@@ -64,26 +72,49 @@ class GraphBuilder:
                     if target in self.graph:
                         self.graph.add_edge(source, target)
 
-        with open(cache_file, "wb") as f:
-            pickle.dump(self.graph, f)
-
-    def get_neighbors(self, table_key: str, hops: int) -> Set[str]:
+        # Node names once, edges as index pairs into them: no pickle, no coupling
+        # to the NetworkX version, and no table key repeated per edge
+        nodes = list(self.graph.nodes)
+        node_index = {node: i for i, node in enumerate(nodes)}
+        edges = [
+            (node_index[source], node_index[target])
+            for source, target in self.graph.edges
+        ]
+        cache_file.write_bytes(orjson.dumps({"nodes": nodes, "edges": edges}))
+
+    def get_neighbors(self, table_key: str, hops: int) -> FrozenSet[str]:
         """Get neighboring tables within N hops via foreign key relationships."""
-        if table_key not in self.graph:
-            return set()
-
-        neighbors: Set[str] = set()
+        cache_key = (table_key, hops)
+        cached = self._neighbor_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        forward = nx.single_source_shortest_path_length(
-            self.graph, table_key, cutoff=hops
-        )
-        neighbors.update(forward.keys())
-
-        backward = nx.single_source_shortest_path_length(
-            self.graph.reverse(), table_key, cutoff=hops
-        )
-        neighbors.update(backward.keys())
+        if table_key not in self.graph:
+            return frozenset()
 
+        # Walk successor and predecessor adjacency directly; graph.reverse()
+        # would copy the whole graph on every call
+        neighbors = _reachable_within(self.graph.succ, table_key, hops)
+        neighbors.update(_reachable_within(self.graph.pred, table_key, hops))
         neighbors.discard(table_key)
 
-        return neighbors
+        result = frozenset(neighbors)
+        self._neighbor_cache[cache_key] = result
+        return result
+
+
+def _reachable_within(adjacency, source: str, hops: int) -> Set[str]:
+    """Nodes reachable from source in at most `hops` steps along adjacency."""
+    seen = {source}
+    frontier = [source]
+    for _ in range(hops):
+        next_frontier = []
+        for node in frontier:
+            for neighbor in adjacency[node]:
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    next_frontier.append(neighbor)
+        if not next_frontier:
+            break
+        frontier = next_frontier
+    return seen
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List, Tuple, Optional, TYPE_CHECKING
 import logging
 
@@ -11,6 +12,18 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _load_cross_encoder(model_name: str) -> "CrossEncoder":
+    """Load a CrossEncoder once per process; SchemaSearch instances share the weights."""
+    sentence_transformers = lazy_import_check(
+        "sentence_transformers", "semantic", "reranking with CrossEncoder"
+    )
+    logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
+    model = sentence_transformers.CrossEncoder(model_name)
+    logger.info(f"Loaded CrossEncoder: {model_name}")
+    return model
+
+
 class CrossEncoderRanker(BaseRanker):
     def __init__(self, model_name: str):
         super().__init__()
@@ -19,13 +32,7 @@ class CrossEncoderRanker(BaseRanker):
 
     def _load_model(self) -> "CrossEncoder":
         if self.model is None:
-            sentence_transformers = lazy_import_check(
-                "sentence_transformers", "semantic", "reranking with CrossEncoder"
-            )
-            logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
-            self.model = sentence_transformers.CrossEncoder(self.model_name)
-            assert self.model is not None
-            logger.info(f"Loaded CrossEncoder: {self.model_name}")
+            self.model = _load_cross_encoder(self.model_name)
         return self.model
 
     def build(self, chunks: List[Chunk]) -> None:
@@ -37,4 +44,5 @@ class CrossEncoderRanker(BaseRanker):
         pairs = [(query, chunk.content) for chunk in self.chunks]
         scores = model.predict(pairs, show_progress_bar=False)
         ranked_indices = scores.argsort()[::-1]
-        return [(int(idx), float(scores[idx])) for idx in ranked_indices]
+        # tolist() unboxes each array to Python ints/floats in one C pass
+        return list(zip(ranked_indices.tolist(), scores[ranked_indices].tolist()))
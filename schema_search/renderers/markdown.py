@@ -84,49 +84,52 @@ class MarkdownRenderer(BaseRenderer):
         columns = schema.get("columns")
         if columns:
             lines.append("**Columns**:")
-            for col in columns:
-                lines.append(self._render_column(col))
+            lines.extend(self._render_column(col) for col in columns)
             lines.append("")
 
         # Foreign keys
         foreign_keys = schema.get("foreign_keys")
         if foreign_keys:
             lines.append("**Foreign Keys**:")
-            for fk in foreign_keys:
-                constrained = ", ".join(fk["constrained_columns"])
-                referred = ", ".join(fk["referred_columns"])
-                ref_table = f"{fk['referred_schema']}.{fk['referred_table']}"
-                lines.append(f"  - {constrained} -> {ref_table}({referred})")
+            lines.extend(
+                f"  - {', '.join(fk['constrained_columns'])} -> "
+                f"{fk['referred_schema']}.{fk['referred_table']}"
+                f"({', '.join(fk['referred_columns'])})"
+                for fk in foreign_keys
+            )
             lines.append("")
 
         # Indices
         indices = schema.get("indices")
         if indices:
             lines.append("**Indices**:")
-            for idx in indices:
-                if idx["name"]:
-                    unique = "UNIQUE " if idx["unique"] else ""
-                    cols = ", ".join(idx["columns"])
-                    lines.append(f"  - {unique}{idx['name']}: ({cols})")
+            lines.extend(
+                f"  - {'UNIQUE ' if idx['unique'] else ''}{idx['name']}: "
+                f"({', '.join(idx['columns'])})"
+                for idx in indices
+                if idx["name"]
+            )
             lines.append("")
 
         # Unique constraints
         unique_constraints = schema.get("unique_constraints")
         if unique_constraints:
             lines.append("**Unique Constraints**:")
-            for constraint in unique_constraints:
-                name = constraint.get("name") or "unnamed"
-                cols = ", ".join(constraint["columns"])
-                lines.append(f"  - {name}: ({cols})")
+            lines.extend(
+                f"  - {constraint.get('name') or 'unnamed'}: "
+                f"({', '.join(constraint['columns'])})"
+                for constraint in unique_constraints
+            )
             lines.append("")
 
         # Check constraints
         check_constraints = schema.get("check_constraints")
         if check_constraints:
             lines.append("**Check Constraints**:")
-            for constraint in check_constraints:
-                name = constraint.get("name") or "unnamed"
-                lines.append(f"  - {name}: `{constraint['sqltext']}`")
+            lines.extend(
+                f"  - {constraint.get('name') or 'unnamed'}: `{constraint['sqltext']}`"
+                for constraint in check_constraints
+            )
             lines.append("")
 
         return "\n".join(lines)
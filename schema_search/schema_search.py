@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from sqlalchemy.engine import Engine
 
@@ -39,10 +39,13 @@ class SchemaSearch:
 
         self.schemas: DBSchema = {}
         self.chunks: List[Chunk] = []
+        self._table_to_chunks: Dict[str, List[int]] = {}
         self.cache_dir = cache_dir
 
         self.extractor = create_extractor(engine, self.config)
-        self.chunker = create_chunker(self.config, llm_api_key, llm_base_url)
+        self.chunker = create_chunker(
+            self.config, llm_api_key, llm_base_url, cache_dir
+        )
         self._embedding_cache = None
         self._bm25_cache = None
         self.graph_builder = GraphBuilder(cache_dir)
@@ -70,7 +73,12 @@ class SchemaSearch:
         self.schemas = current_schema
         self.graph_builder.build(self.schemas, effective_force)
         self.chunks = self._load_or_generate_chunks(effective_force)
-        self._index_force = effective_force
+        self._table_to_chunks = {}
+        for idx, chunk in enumerate(self.chunks):
+            self._table_to_chunks.setdefault(chunk.table_key, []).append(idx)
+        # Only an explicit force bypasses the embedding and BM25 caches; they
+        # detect schema changes themselves from chunk content and reuse rows
+        self._index_force = force
 
         table_count = sum(len(tables) for tables in self.schemas.values())
         logger.info(
@@ -113,21 +121,25 @@ class SchemaSearch:
 
     def _get_bm25_cache(self):
         if self._bm25_cache is None:
-            self._bm25_cache = BM25Cache()
+            self._bm25_cache = BM25Cache(
+                self.cache_dir, self.config["search"].get("bm25_backend", "numpy")
+            )
         return self._bm25_cache
 
     def _ensure_embeddings_loaded(self):
         cache = self._get_embedding_cache()
-        if cache.embeddings is None:
+        # Same rule as BM25: reload when index() replaced the chunk list
+        if cache.embeddings is None or cache.chunks is not self.chunks:
             cache.load_or_generate(
                 self.chunks, self._index_force, self.config["chunking"]
             )
 
     def _ensure_bm25_built(self):
         cache = self._get_bm25_cache()
-        if cache.bm25 is None:
+        # Rebuild after index() replaced the chunk list, not just on first use
+        if cache.bm25 is None or cache.chunks is not self.chunks:
             logger.info("Building BM25 index")
-            cache.build(self.chunks)
+            cache.build(self.chunks, self._index_force)
 
     def _get_search_strategy(self, search_type: str):
         if search_type not in self._search_strategies:
@@ -160,13 +172,16 @@ class SchemaSearch:
         if not catalogs and not schemas:
             return self.schemas
 
+        catalog_set = set(catalogs) if catalogs else None
+        schema_set = set(schemas) if schemas else None
+
         result: DBSchema = {}
         for schema_key, tables in self.schemas.items():
             catalog, schema_name = Chunk.parse_schema_key(schema_key)
 
-            if catalogs and catalog not in catalogs:
+            if catalog_set and catalog not in catalog_set:
                 continue
-            if schemas and schema_name not in schemas:
+            if schema_set and schema_name not in schema_set:
                 continue
 
             result[schema_key] = tables
@@ -225,6 +240,7 @@ class SchemaSearch:
             query=query,
             db_schema=self.schemas,
             chunks=self.chunks,
+            table_to_chunks=self._table_to_chunks,
             graph_builder=self.graph_builder,
             hops=hops,
             limit=limit,
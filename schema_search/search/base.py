@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from abc import ABC, abstractmethod
 
 from schema_search.types import Chunk, DBSchema, SearchResultItem
@@ -19,6 +19,7 @@ class BaseSearchStrategy(ABC):
         query: str,
         db_schema: DBSchema,
         chunks: List[Chunk],
+        table_to_chunks: Dict[str, List[int]],
         graph_builder: GraphBuilder,
         hops: int,
         limit: int,
@@ -35,12 +36,11 @@ class BaseSearchStrategy(ABC):
         if self.reranker is None:
             return initial_results[:limit]
 
-        initial_chunks = []
-        for result in initial_results:
-            for chunk in chunks:
-                if chunk.table_key == result["table"]:
-                    initial_chunks.append(chunk)
-                    break
+        initial_chunks = [
+            chunks[table_to_chunks[result["table"]][0]]
+            for result in initial_results
+            if result["table"] in table_to_chunks
+        ]
 
         self.reranker.build(initial_chunks)
         ranked = self.reranker.rank(query)
@@ -66,14 +66,17 @@ class BaseSearchStrategy(ABC):
         schemas: Optional[List[str]],
     ) -> List[SearchResultItem]:
         """Filter results by catalog and/or schema."""
+        catalog_set = set(catalogs) if catalogs else None
+        schema_set = set(schemas) if schemas else None
+
         filtered = []
         for result in results:
             table_key = result["table"]
             catalog, schema_name = Chunk.parse_schema_key(table_key.rsplit(".", 1)[0])
 
-            if catalogs and catalog not in catalogs:
+            if catalog_set and catalog not in catalog_set:
                 continue
-            if schemas and schema_name not in schemas:
+            if schema_set and schema_name not in schema_set:
                 continue
 
             filtered.append(result)
@@ -1,6 +1,7 @@
 from typing import List, Optional, TYPE_CHECKING
 
 from schema_search.search.base import BaseSearchStrategy
+from schema_search.utils.utils import top_k_indices
 from schema_search.types import DBSchema, SearchResultItem
 from schema_search.types import Chunk
 from schema_search.graph_builder import GraphBuilder
@@ -30,7 +31,7 @@ class BM25SearchStrategy(BaseSearchStrategy):
         hops: int,
     ) -> List[SearchResultItem]:
         scores = self.bm25_cache.get_scores(query)
-        top_indices = scores.argsort()[::-1][: self.initial_top_k]
+        top_indices = top_k_indices(scores, self.initial_top_k)
 
         results: List[SearchResultItem] = []
         for idx in top_indices:
@@ -1,6 +1,8 @@
+import heapq
 from typing import List, Optional, Tuple
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from schema_search.search.base import BaseSearchStrategy
 from schema_search.types import Chunk, DBSchema, TableSchema, SearchResultItem
@@ -8,11 +10,35 @@ from schema_search.graph_builder import GraphBuilder, make_table_key
 from schema_search.rankers.base import BaseRanker
 
 
+_PARALLEL_MIN_TABLES = 5000
+
+
 class FuzzySearchStrategy(BaseSearchStrategy):
     def __init__(
         self, initial_top_k: int, rerank_top_k: int, reranker: Optional[BaseRanker]
     ):
         super().__init__(reranker, initial_top_k, rerank_top_k)
+        # Per-table search texts depend only on the schema; built once per index()
+        self._indexed_schema: Optional[DBSchema] = None
+        self._table_keys: List[Tuple[str, str]] = []
+        self._searchable_texts: List[str] = []
+
+    def _index_tables(self, db_schema: DBSchema) -> None:
+        if db_schema is self._indexed_schema:
+            return
+
+        table_keys: List[Tuple[str, str]] = []
+        searchable_texts: List[str] = []
+        for schema_name, tables in db_schema.items():
+            for table_name, table_schema in tables.items():
+                table_keys.append((schema_name, table_name))
+                searchable_texts.append(
+                    self._build_searchable_text(table_name, table_schema)
+                )
+
+        self._table_keys = table_keys
+        self._searchable_texts = searchable_texts
+        self._indexed_schema = db_schema
 
     def _initial_ranking(
         self,
@@ -22,19 +48,33 @@ class FuzzySearchStrategy(BaseSearchStrategy):
         graph_builder: GraphBuilder,
         hops: int,
     ) -> List[SearchResultItem]:
-        # (schema_name, table_name, score)
-        scored_tables: List[Tuple[str, str, float]] = []
+        self._index_tables(db_schema)
+        table_keys = self._table_keys
+        searchable_texts = self._searchable_texts
 
-        for schema_name, tables in db_schema.items():
-            for table_name, table_schema in tables.items():
-                searchable_text = self._build_searchable_text(table_name, table_schema)
-                score = fuzz.ratio(query, searchable_text, score_cutoff=0) / 100.0
-                scored_tables.append((schema_name, table_name, score))
+        # One batched C call; threads only pay off on very large schemas
+        workers = -1 if len(searchable_texts) >= _PARALLEL_MIN_TABLES else 1
+        scores = process.cdist(
+            [query],
+            searchable_texts,
+            scorer=fuzz.ratio,
+            dtype=np.float64,
+            workers=workers,
+        )[0] / 100.0
+
+        # (schema_name, table_name, score)
+        scored_tables: List[Tuple[str, str, float]] = [
+            (schema_name, table_name, score)
+            for (schema_name, table_name), score in zip(table_keys, scores.tolist())
+        ]
 
-        scored_tables.sort(key=lambda x: x[2], reverse=True)
+        # Same order as a full descending stable sort, truncated, without sorting all
+        top_tables = heapq.nlargest(
+            self.initial_top_k, scored_tables, key=lambda x: x[2]
+        )
 
         results: List[SearchResultItem] = []
-        for schema_name, table_name, score in scored_tables[: self.initial_top_k]:
+        for schema_name, table_name, score in top_tables:
             table_key = make_table_key(schema_name, table_name)
             table_schema = db_schema[schema_name][table_name]
 
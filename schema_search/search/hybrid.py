@@ -3,6 +3,7 @@ from typing import List, Optional, TYPE_CHECKING
 import numpy as np
 
 from schema_search.search.base import BaseSearchStrategy
+from schema_search.utils.utils import top_k_indices
 from schema_search.types import Chunk, DBSchema, SearchResultItem
 from schema_search.graph_builder import GraphBuilder
 from schema_search.embedding_cache.base import BaseEmbeddingCache
@@ -12,6 +13,18 @@ if TYPE_CHECKING:
     from schema_search.embedding_cache.bm25 import BM25Cache
 
 
+def _weighted_min_max(scores: np.ndarray, weight: float) -> np.ndarray:
+    """weight * min-max normalized scores, using a single output buffer."""
+    score_min = scores.min()
+    score_range = scores.max() - score_min
+    if not score_range > 0:
+        return np.zeros_like(scores)
+    out = np.subtract(scores, score_min)
+    out /= score_range
+    out *= weight
+    return out
+
+
 class HybridSearchStrategy(BaseSearchStrategy):
     def __init__(
         self,
@@ -42,28 +55,11 @@ class HybridSearchStrategy(BaseSearchStrategy):
 
         bm25_scores = self.bm25_cache.get_scores(query)
 
-        semantic_min = semantic_scores.min()
-        semantic_max = semantic_scores.max()
-        semantic_range = semantic_max - semantic_min
-        if semantic_range > 0:
-            semantic_scores_norm = (semantic_scores - semantic_min) / semantic_range
-        else:
-            semantic_scores_norm = np.zeros_like(semantic_scores)
-
-        bm25_min = bm25_scores.min()
-        bm25_max = bm25_scores.max()
-        bm25_range = bm25_max - bm25_min
-        if bm25_range > 0:
-            bm25_scores_norm = (bm25_scores - bm25_min) / bm25_range
-        else:
-            bm25_scores_norm = np.zeros_like(bm25_scores)
-
-        hybrid_scores = (
-            self.semantic_weight * semantic_scores_norm
-            + self.bm25_weight * bm25_scores_norm
-        )
+        # Each term is normalized and weighted in one buffer, then summed in place
+        hybrid_scores = _weighted_min_max(semantic_scores, self.semantic_weight)
+        hybrid_scores += _weighted_min_max(bm25_scores, self.bm25_weight)
 
-        top_indices = hybrid_scores.argsort()[::-1][: self.initial_top_k]
+        top_indices = top_k_indices(hybrid_scores, self.initial_top_k)
 
         results: List[SearchResultItem] = []
         for idx in top_indices:
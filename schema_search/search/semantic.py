@@ -27,15 +27,16 @@ class SemanticSearchStrategy(BaseSearchStrategy):
         hops: int,
     ) -> List[SearchResultItem]:
         query_embedding = self.embedding_cache.encode_query(query)
-        embedding_scores = self.embedding_cache.compute_similarities(query_embedding)
-        top_indices = embedding_scores.argsort()[::-1][: self.initial_top_k]
+        top_indices, top_scores = self.embedding_cache.compute_top_k(
+            query_embedding, self.initial_top_k
+        )
 
         results: List[SearchResultItem] = []
-        for idx in top_indices:
+        for idx, score in zip(top_indices, top_scores):
             chunk = chunks[idx]
             result = self._build_result_item(
                 chunk=chunk,
-                score=float(embedding_scores[idx]),
+                score=float(score),
                 db_schema=db_schema,
                 graph_builder=graph_builder,
                 hops=hops,
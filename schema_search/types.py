@@ -1,5 +1,6 @@
 from typing import TypedDict, List, Literal, Optional, Dict, Tuple
 from dataclasses import dataclass, field
+from functools import cached_property
 
 
 SearchType = Literal["semantic", "fuzzy", "bm25", "hybrid"]
@@ -70,9 +71,12 @@ class Chunk:
             return f"{self.catalog}.{self.schema_name}"
         return self.schema_name
 
-    @property
+    @cached_property
     def table_key(self) -> str:
-        """Key for this chunk's table (catalog.schema.table or schema.table)."""
+        """Key for this chunk's table (catalog.schema.table or schema.table).
+
+        Computed once per chunk; it is read for every result item and lookup.
+        """
         if self.catalog:
             return f"{self.catalog}.{self.schema_name}.{self.table_name}"
         return f"{self.schema_name}.{self.table_name}"
@@ -1,15 +1,32 @@
 """Cache I/O utilities for schema and chunk persistence."""
 
-import json
 import logging
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Callable, Dict, List, Optional
+
+import orjson
 
 from schema_search.types import Chunk, DBSchema
 
 logger = logging.getLogger(__name__)
 
 
+def write_atomic(path: Path, write: Callable[[BinaryIO], None]) -> None:
+    """Write a file through a temp file and rename it into place.
+
+    Readers, including a concurrent or later run, never see a partial file.
+
+    Args:
+        path: Destination file.
+        write: Callback that writes the contents to the open temp file.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
 def load_schema(cache_dir: Path) -> Optional[DBSchema]:
     """Load cached schema from disk.
 
@@ -25,8 +42,7 @@ def load_schema(cache_dir: Path) -> Optional[DBSchema]:
         logger.debug("Schema cache missing")
         return None
 
-    with open(schema_cache) as f:
-        return json.load(f)
+    return orjson.loads(schema_cache.read_bytes())
 
 
 def save_schema(cache_dir: Path, schema: DBSchema) -> None:
@@ -37,8 +53,7 @@ def save_schema(cache_dir: Path, schema: DBSchema) -> None:
         schema: Schema to save.
     """
     schema_cache = cache_dir / "metadata.json"
-    with open(schema_cache, "w") as f:
-        json.dump(schema, f, indent=2)
+    write_atomic(schema_cache, lambda f: f.write(orjson.dumps(schema)))
 
 
 def schema_changed(cached: Optional[DBSchema], current: DBSchema) -> bool:
@@ -76,19 +91,18 @@ def load_chunks(cache_dir: Path) -> Optional[List[Chunk]]:
 
     logger.info(f"Loading chunks from cache: {chunks_cache}")
     try:
-        with open(chunks_cache) as f:
-            chunk_data = json.load(f)
-            return [
-                Chunk(
-                    catalog=c.get("catalog"),
-                    schema_name=c["schema_name"],
-                    table_name=c["table_name"],
-                    content=c["content"],
-                    chunk_id=c["chunk_id"],
-                    token_count=c["token_count"],
-                )
-                for c in chunk_data
-            ]
+        chunk_data = orjson.loads(chunks_cache.read_bytes())
+        return [
+            Chunk(
+                catalog=c.get("catalog"),
+                schema_name=c["schema_name"],
+                table_name=c["table_name"],
+                content=c["content"],
+                chunk_id=c["chunk_id"],
+                token_count=c["token_count"],
+            )
+            for c in chunk_data
+        ]
     except Exception as e:
         logger.warning(f"Failed to load chunks cache: {e}")
         return None
@@ -102,16 +116,47 @@ def save_chunks(cache_dir: Path, chunks: List[Chunk]) -> None:
         chunks: Chunks to save.
     """
     chunks_cache = cache_dir / "chunk_metadata.json"
-    with open(chunks_cache, "w") as f:
-        chunk_data = [
-            {
-                "catalog": c.catalog,
-                "schema_name": c.schema_name,
-                "table_name": c.table_name,
-                "content": c.content,
-                "chunk_id": c.chunk_id,
-                "token_count": c.token_count,
-            }
-            for c in chunks
-        ]
-        json.dump(chunk_data, f, indent=2)
+    chunk_data = [
+        {
+            "catalog": c.catalog,
+            "schema_name": c.schema_name,
+            "table_name": c.table_name,
+            "content": c.content,
+            "chunk_id": c.chunk_id,
+            "token_count": c.token_count,
+        }
+        for c in chunks
+    ]
+    write_atomic(chunks_cache, lambda f: f.write(orjson.dumps(chunk_data)))
+
+
+def load_summaries(cache_dir: Path) -> Dict[str, str]:
+    """Load cached LLM table summaries from disk.
+
+    Args:
+        cache_dir: Directory containing cache files.
+
+    Returns:
+        Mapping of summary key to summary text (empty if not found).
+    """
+    summaries_cache = cache_dir / "llm_summaries.json"
+
+    if not summaries_cache.exists():
+        return {}
+
+    try:
+        return orjson.loads(summaries_cache.read_bytes())
+    except Exception as e:
+        logger.warning(f"Failed to load LLM summaries cache: {e}")
+        return {}
+
+
+def save_summaries(cache_dir: Path, summaries: Dict[str, str]) -> None:
+    """Save LLM table summaries to cache.
+
+    Args:
+        cache_dir: Directory for cache files.
+        summaries: Mapping of summary key to summary text.
+    """
+    summaries_cache = cache_dir / "llm_summaries.json"
+    write_atomic(summaries_cache, lambda f: f.write(orjson.dumps(summaries)))
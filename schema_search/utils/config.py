@@ -1,11 +1,16 @@
 """Configuration loading and validation utilities."""
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import yaml
 
-from schema_search.utils.utils import lazy_import_check
+from schema_search.utils.utils import check_installed
+
+# libyaml's C parser when PyYAML was built with it; same safe semantics
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def load_config(config_path: Optional[str]) -> Dict[str, Any]:
@@ -20,8 +25,15 @@ def load_config(config_path: Optional[str]) -> Dict[str, Any]:
     if config_path is None:
         config_path = str(Path(__file__).parent.parent.parent / "config.yml")
 
+    # Parse once per file version; callers get their own copy to mutate
+    mtime_ns = Path(config_path).stat().st_mtime_ns
+    return copy.deepcopy(_parse_config(config_path, mtime_ns))
+
+
+@lru_cache(maxsize=16)
+def _parse_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def validate_dependencies(config: Dict[str, Any]) -> None:
@@ -39,11 +51,17 @@ def validate_dependencies(config: Dict[str, Any]) -> None:
 
     needs_semantic = strategy in ("semantic", "hybrid") or reranker_model
     if needs_semantic:
-        lazy_import_check(
+        check_installed(
             "sentence_transformers",
             "semantic",
             f"{strategy} search or reranking"
         )
 
+    if config["embedding"].get("ann", False) and needs_semantic:
+        check_installed("faiss", "ann", "approximate nearest neighbour search")
+
+    if config["search"].get("bm25_backend", "numpy") == "numba":
+        check_installed("numba", "numba", "the numba BM25 backend")
+
     if chunking_strategy == "llm":
-        lazy_import_check("openai", "llm", "LLM-based chunking")
+        check_installed("openai", "llm", "LLM-based chunking")
@@ -3,25 +3,35 @@
 import logging
 import os
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from importlib import import_module
+from importlib.util import find_spec
 from typing import Any, Dict
-from urllib.parse import parse_qs, urlparse, urlunparse
+from urllib.parse import ParseResult, parse_qs, urlencode, urlparse, urlunparse
 
-from sqlalchemy import Engine, create_engine
+import numpy as np
+from sqlalchemy import Engine, QueuePool, create_engine, make_url
 
 from schema_search.types import SearchResult
 
 logger = logging.getLogger(__name__)
 
+# LIFO reuses the most recent connection and lets idle overflow drain;
+# recycle drops connections before servers time them out. No pre-ping: it
+# costs a round trip per checkout, and reflection checks out many times.
+_POOL_DEFAULTS: Dict[str, Any] = {
+    "pool_use_lifo": True,
+    "pool_recycle": 1800,
+}
+
 
 def time_it(func):
     """Decorator to measure function execution time."""
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
+        start = time.perf_counter()
         result = func(*args, **kwargs)
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         if isinstance(result, dict):
             result["latency_sec"] = round(elapsed, 3)
@@ -33,6 +43,21 @@ def time_it(func):
     return wrapper
 
 
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first.
+
+    Partitions in O(N) and sorts only the k survivors instead of the whole array.
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        candidates = np.argpartition(scores, len(scores) - k)[-k:]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[scores[candidates].argsort()[::-1]]
+
+
 def lazy_import_check(module_name: str, extra_name: str, feature: str) -> Any:
     """Lazily import a module and provide helpful error if missing.
 
@@ -50,10 +75,38 @@ def lazy_import_check(module_name: str, extra_name: str, feature: str) -> Any:
     try:
         return import_module(module_name)
     except ImportError as e:
-        raise ImportError(
-            f"'{module_name}' is required for {feature}. "
-            f"Install with: pip install schema-search[{extra_name}]"
-        ) from e
+        raise _missing_extra_error(module_name, extra_name, feature) from e
+
+
+def check_installed(module_name: str, extra_name: str, feature: str) -> None:
+    """Check that a module is installed without importing it.
+
+    Locates the module's spec only, so validating heavy optional dependencies
+    (e.g., sentence_transformers and torch) does not pay their import cost.
+
+    Args:
+        module_name: Python module to look up (e.g., "sentence_transformers")
+        extra_name: pip extra name (e.g., "semantic")
+        feature: User-facing feature description (e.g., "semantic search")
+
+    Raises:
+        ImportError: With installation instructions if module not found
+    """
+    try:
+        spec = find_spec(module_name)
+    except ImportError as e:
+        raise _missing_extra_error(module_name, extra_name, feature) from e
+    if spec is None:
+        raise _missing_extra_error(module_name, extra_name, feature)
+
+
+def _missing_extra_error(
+    module_name: str, extra_name: str, feature: str
+) -> ImportError:
+    return ImportError(
+        f"'{module_name}' is required for {feature}. "
+        f"Install with: pip install schema-search[{extra_name}]"
+    )
 
 
 def setup_logging(config: Dict[str, Any]) -> None:
@@ -63,6 +116,13 @@ def setup_logging(config: Dict[str, Any]) -> None:
         config: Configuration dictionary with logging.level key.
     """
     level = getattr(logging, config["logging"]["level"])
+    root = logging.getLogger()
+    # Already configured at this level (e.g., an earlier SchemaSearch): keep
+    # the existing handlers rather than tearing them down and reinstalling
+    if root.handlers and root.level == level:
+        logger.setLevel(level)
+        return
+
     logging.basicConfig(
         level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -80,22 +140,23 @@ def _load_snowflake_private_key(key_path: str) -> bytes:
     Returns:
         Private key bytes in DER format for Snowflake connector.
     """
+    key_path = os.path.expanduser(key_path)
+    # Parse once per file version; a rotated key has a new mtime
+    return _read_snowflake_private_key(key_path, os.stat(key_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _read_snowflake_private_key(key_path: str, mtime_ns: int) -> bytes:
     serialization = lazy_import_check(
         "cryptography.hazmat.primitives.serialization",
         "snowflake",
         "Snowflake key-pair authentication",
     )
-    default_backend = lazy_import_check(
-        "cryptography.hazmat.backends",
-        "snowflake",
-        "Snowflake key-pair authentication",
-    ).default_backend
 
-    with open(os.path.expanduser(key_path), "rb") as key_file:
+    with open(key_path, "rb", buffering=0) as key_file:
         private_key = serialization.load_pem_private_key(
             key_file.read(),
             password=None,
-            backend=default_backend(),
         )
     return private_key.private_bytes(
         encoding=serialization.Encoding.DER,
@@ -104,76 +165,131 @@ def _load_snowflake_private_key(key_path: str) -> bytes:
     )
 
 
-def _parse_snowflake_url(url: str) -> tuple[str, str | None]:
-    """Parse Snowflake URL and extract private_key_path parameter.
+def _parse_snowflake_url(parsed: ParseResult) -> tuple[str, str | None]:
+    """Extract the private_key_path parameter from a parsed Snowflake URL.
 
     Args:
-        url: Snowflake connection URL with optional private_key_path param.
+        parsed: Snowflake connection URL with optional private_key_path param,
+            as already parsed by create_engine_from_url.
 
     Returns:
         Tuple of (clean_url without private_key_path, key_path or None).
     """
-    parsed = urlparse(url)
+    if "private_key_path" not in parsed.query:
+        return urlunparse(parsed), None
+
     params = parse_qs(parsed.query)
 
     key_path = params.pop("private_key_path", [None])[0]
 
-    new_query = "&".join(f"{k}={v[0]}" for k, v in params.items())
+    # parse_qs decoded the values; urlencode quotes them again
+    new_query = urlencode({k: v[0] for k, v in params.items()})
     clean_url = urlunparse(parsed._replace(query=new_query))
 
     return clean_url, key_path
 
 
-def _create_snowflake_engine(url: str) -> Engine:
+def _create_snowflake_engine(
+    parsed: ParseResult, engine_kwargs: Dict[str, Any]
+) -> Engine:
     """Create SQLAlchemy engine for Snowflake with key-pair auth support.
 
     Args:
-        url: Snowflake URL, optionally with private_key_path parameter.
+        parsed: Parsed Snowflake URL, optionally with private_key_path parameter.
+        engine_kwargs: Extra keyword arguments for create_engine.
 
     Returns:
         SQLAlchemy Engine configured for Snowflake.
     """
-    clean_url, key_path = _parse_snowflake_url(url)
+    clean_url, key_path = _parse_snowflake_url(parsed)
 
     if key_path:
         private_key = _load_snowflake_private_key(key_path)
-        return create_engine(clean_url, connect_args={"private_key": private_key})
+        connect_args = {
+            **engine_kwargs.get("connect_args", {}),
+            "private_key": private_key,
+        }
+        engine_kwargs = {**engine_kwargs, "connect_args": connect_args}
 
-    return create_engine(clean_url)
+    return _create_engine(clean_url, engine_kwargs)
 
 
-def _create_databricks_engine(url: str) -> Engine:
+def _create_databricks_engine(url: str, engine_kwargs: Dict[str, Any]) -> Engine:
     """Create SQLAlchemy engine for Databricks with required connect_args.
 
     Args:
         url: Databricks connection URL.
+        engine_kwargs: Extra keyword arguments for create_engine.
 
     Returns:
         SQLAlchemy Engine configured for Databricks.
     """
-    return create_engine(url, connect_args={"user_agent_entry": "schema-search"})
+    connect_args = {
+        "user_agent_entry": "schema-search",
+        **engine_kwargs.get("connect_args", {}),
+    }
+    return _create_engine(url, {**engine_kwargs, "connect_args": connect_args})
+
+
+def _create_engine(url: str, engine_kwargs: Dict[str, Any]) -> Engine:
+    """create_engine with the pool defaults the caller left unset.
+
+    Defaults apply only when the engine will use a QueuePool; other pools
+    (e.g., SQLite's SingletonThreadPool, NullPool) reject LIFO options.
+    """
+    if "pool" not in engine_kwargs:
+        poolclass = engine_kwargs.get("poolclass")
+        if poolclass is None:
+            parsed_url = make_url(url)
+            poolclass = parsed_url.get_dialect().get_pool_class(parsed_url)
+        if issubclass(poolclass, QueuePool):
+            engine_kwargs = {**_POOL_DEFAULTS, **engine_kwargs}
 
+    return create_engine(url, **engine_kwargs)
 
-def create_engine_from_url(url: str) -> Engine:
+
+def create_engine_from_url(url: str, **engine_kwargs: Any) -> Engine:
     """Create SQLAlchemy engine from URL with DB-specific handling.
 
+    Without engine_kwargs, engines are cached per URL, so repeated calls share
+    one Engine and its connection pool. Call ``.dispose()`` on the result or
+    pass a distinct URL when a fresh pool is needed. Calls with engine_kwargs
+    always build a new engine.
+
     Handles special cases:
     - Snowflake: Extracts private_key_path param and loads key for auth.
     - Databricks: Adds required user_agent_entry to connect_args.
     - Others: Standard create_engine call.
 
+    QueuePool engines default to LIFO checkout and a 30 minute recycle unless
+    engine_kwargs sets those options.
+
     Args:
         url: Database connection URL.
+        **engine_kwargs: Extra keyword arguments for create_engine.
 
     Returns:
         SQLAlchemy Engine for the specified database.
     """
+    if engine_kwargs:
+        # Options such as connect_args are dicts, which cannot key a cache
+        return _build_engine(url, engine_kwargs)
+    return _cached_engine(url)
+
+
+@lru_cache(maxsize=128)
+def _cached_engine(url: str) -> Engine:
+    return _build_engine(url, {})
+
+
+def _build_engine(url: str, engine_kwargs: Dict[str, Any]) -> Engine:
+    # Parsed once here; the Snowflake branch reuses it for the query string
     parsed = urlparse(url)
     dialect = parsed.scheme.split("+")[0]
 
     if dialect == "snowflake":
-        return _create_snowflake_engine(url)
+        return _create_snowflake_engine(parsed, engine_kwargs)
     elif dialect == "databricks":
-        return _create_databricks_engine(url)
+        return _create_databricks_engine(url, engine_kwargs)
     else:
-        return create_engine(url)
+        return _create_engine(url, engine_kwargs)
@@ -0,0 +1,19 @@
+import os
+from pathlib import Path
+
+import pytest
+from dotenv import load_dotenv
+
+
+@pytest.fixture(scope="session", autouse=True)
+def load_env():
+    load_dotenv(Path(__file__).parent / ".env")
+
+
+@pytest.fixture(scope="session")
+def database_url():
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        pytest.skip("DATABASE_URL not set in tests/.env file")
+
+    return url
@@ -0,0 +1,302 @@
+"""Offline tests for the on-disk caches, using SQLite and stub models."""
+
+import sqlite3
+import sys
+import threading
+import types
+import zlib
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import orjson
+import pytest
+import yaml
+from sqlalchemy import create_engine
+
+from schema_search import SchemaSearch
+from schema_search.chunkers.llm import LLMChunker
+from schema_search.embedding_cache import bm25 as bm25_module
+from schema_search.embedding_cache.batching import QueryBatcher
+from schema_search.embedding_cache.bm25 import BM25Cache
+from schema_search.types import TableSchema
+
+CONFIG_TEMPLATE = Path(__file__).parent.parent / "config.yml"
+
+
+class StubEncoder:
+    """Stands in for SentenceTransformer: hashed bag-of-words vectors."""
+
+    dim = 32
+
+    def __init__(self):
+        self.calls: List[List[str]] = []
+
+    def encode(self, texts, batch_size=32, normalize_embeddings=False, **kwargs):
+        self.calls.append(list(texts))
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[row, zlib.crc32(word.encode()) % self.dim] += 1.0
+        if normalize_embeddings:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True).clip(1e-12)
+        return vectors
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    # SchemaSearch names the cache dir after the database path, so keep it relative
+    monkeypatch.chdir(tmp_path)
+    con = sqlite3.connect(tmp_path / "shop.db")
+    con.executescript(
+        """
+        CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT NOT NULL, name TEXT);
+        CREATE TABLE orders (
+            id INTEGER PRIMARY KEY,
+            user_id INTEGER REFERENCES users(id),
+            total REAL
+        );
+        CREATE TABLE refunds (
+            id INTEGER PRIMARY KEY,
+            order_id INTEGER REFERENCES orders(id),
+            amount REAL
+        );
+        """
+    )
+    con.close()
+    return tmp_path / "shop.db"
+
+
+@pytest.fixture
+def engine(sqlite_db):
+    return create_engine("sqlite:///shop.db")
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    config = yaml.safe_load(CONFIG_TEMPLATE.read_text())
+    config["embedding"]["cache_dir"] = str(tmp_path / "cache")
+    path = tmp_path / "config.yml"
+    path.write_text(yaml.safe_dump(config))
+    return str(path)
+
+
+def _alter(sqlite_db: Path, statement: str) -> None:
+    con = sqlite3.connect(sqlite_db)
+    con.execute(statement)
+    con.commit()
+    con.close()
+
+
+def _semantic_search(search: SchemaSearch, encoder: StubEncoder) -> None:
+    search.embedding_cache.model = encoder
+    search.search("customer email", search_type="semantic")
+
+
+def _document_calls(encoder: StubEncoder) -> List[List[str]]:
+    return [call for call in encoder.calls if call != ["customer email"]]
+
+
+def test_changed_table_reencodes_only_its_chunks(engine, config_path, sqlite_db):
+    first = SchemaSearch(engine, config_path=config_path)
+    first.index()
+    _semantic_search(first, StubEncoder())
+
+    _alter(sqlite_db, "ALTER TABLE refunds ADD COLUMN reason TEXT")
+
+    encoder = StubEncoder()
+    second = SchemaSearch(engine, config_path=config_path)
+    second.index()
+    _semantic_search(second, encoder)
+
+    refund_chunks = [c.content for c in second.chunks if c.table_name == "refunds"]
+    assert _document_calls(encoder) == [refund_chunks]
+
+    # Reused rows plus fresh ones match a full encode (up to the fp16 cache)
+    expected = StubEncoder().encode(
+        [c.content for c in second.chunks], normalize_embeddings=True
+    )
+    np.testing.assert_allclose(second.embedding_cache.embeddings, expected, atol=1e-3)
+
+
+def test_force_reencodes_every_chunk(engine, config_path):
+    first = SchemaSearch(engine, config_path=config_path)
+    first.index()
+    _semantic_search(first, StubEncoder())
+
+    encoder = StubEncoder()
+    second = SchemaSearch(engine, config_path=config_path)
+    second.index(force=True)
+    _semantic_search(second, encoder)
+
+    assert _document_calls(encoder) == [[c.content for c in second.chunks]]
+
+
+def test_unchanged_schema_encodes_only_the_query(engine, config_path):
+    first = SchemaSearch(engine, config_path=config_path)
+    first.index()
+    _semantic_search(first, StubEncoder())
+
+    encoder = StubEncoder()
+    second = SchemaSearch(engine, config_path=config_path)
+    second.index()
+    _semantic_search(second, encoder)
+
+    assert _document_calls(encoder) == []
+
+
+def test_reindex_refreshes_embeddings(engine, config_path, sqlite_db):
+    search = SchemaSearch(engine, config_path=config_path)
+    search.index()
+    _semantic_search(search, StubEncoder())
+
+    _alter(sqlite_db, "CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)")
+    search.index()
+    search.search("customer email", search_type="semantic")
+
+    assert len(search.embedding_cache.embeddings) == len(search.chunks)
+
+
+@pytest.fixture
+def bm25_saves(monkeypatch):
+    saves = []
+    original = BM25Cache._save
+
+    def counting_save(self, digest):
+        saves.append(digest)
+        original(self, digest)
+
+    monkeypatch.setattr(BM25Cache, "_save", counting_save)
+    return saves
+
+
+def test_bm25_reloads_when_digest_matches(engine, config_path, bm25_saves):
+    search = SchemaSearch(engine, config_path=config_path)
+    search.index()
+
+    BM25Cache(search.cache_dir).build(search.chunks)
+    reloaded = BM25Cache(search.cache_dir)
+    reloaded.build(search.chunks)
+
+    assert len(bm25_saves) == 1
+    assert reloaded.get_scores("email").shape == (len(search.chunks),)
+
+
+def test_bm25_rebuilds_when_chunks_change(engine, config_path, bm25_saves):
+    search = SchemaSearch(engine, config_path=config_path)
+    search.index()
+
+    BM25Cache(search.cache_dir).build(search.chunks)
+    BM25Cache(search.cache_dir).build(search.chunks[:-1])
+
+    assert len(bm25_saves) == 2
+
+
+def test_bm25_rebuilds_when_tokenizer_changes(
+    engine, config_path, bm25_saves, monkeypatch
+):
+    search = SchemaSearch(engine, config_path=config_path)
+    search.index()
+
+    BM25Cache(search.cache_dir).build(search.chunks)
+    monkeypatch.setattr(bm25_module, "_TOKENIZER_VERSION", "test")
+    BM25Cache(search.cache_dir).build(search.chunks)
+
+    assert len(bm25_saves) == 2
+
+
+class StubLLMChunker(LLMChunker):
+    """Records summarize calls instead of calling an LLM."""
+
+    def __init__(self, cache_dir: Path, fail_on: str = ""):
+        super().__init__(
+            max_tokens=256,
+            overlap_tokens=50,
+            model="stub-model",
+            llm_api_key=None,
+            llm_base_url=None,
+            cache_dir=cache_dir,
+        )
+        self.fail_on = fail_on
+        self.summarized: List[str] = []
+        self._lock = threading.Lock()
+
+    def _summarize(self, table_name: str, schema: TableSchema) -> str:
+        if table_name == self.fail_on:
+            raise RuntimeError(f"summary failed for {table_name}")
+        with self._lock:
+            self.summarized.append(table_name)
+        return f"Summary of {table_name}"
+
+
+@pytest.fixture
+def db_schema(engine, config_path, monkeypatch):
+    # LLMChunker only needs the client class at construction time
+    monkeypatch.setitem(
+        sys.modules, "openai", types.SimpleNamespace(OpenAI=lambda **kwargs: None)
+    )
+    return SchemaSearch(engine, config_path=config_path).extractor.extract()
+
+
+def test_llm_summaries_served_from_cache(tmp_path, db_schema):
+    first = StubLLMChunker(tmp_path)
+    first_chunks = first.chunk_schemas(db_schema)
+    assert sorted(first.summarized) == ["orders", "refunds", "users"]
+
+    second = StubLLMChunker(tmp_path)
+    second_chunks = second.chunk_schemas(db_schema)
+
+    assert second.summarized == []
+    assert [c.content for c in second_chunks] == [c.content for c in first_chunks]
+
+
+def test_completed_summaries_survive_a_failing_table(tmp_path, db_schema):
+    failing = StubLLMChunker(tmp_path, fail_on="orders")
+    with pytest.raises(RuntimeError, match="orders"):
+        failing.chunk_schemas(db_schema)
+
+    cached = orjson.loads((tmp_path / "llm_summaries.json").read_bytes())
+    assert sorted(cached.values()) == ["Summary of refunds", "Summary of users"]
+
+    retry = StubLLMChunker(tmp_path)
+    retry.chunk_schemas(db_schema)
+    assert retry.summarized == ["orders"]
+
+
+def test_query_batcher_coalesces_concurrent_queries():
+    encoder = StubEncoder()
+    batcher = QueryBatcher(encoder.encode, window_sec=0.2, max_batch=4)
+    results = {}
+
+    def run(query):
+        results[query] = batcher.encode(query)
+
+    threads = [threading.Thread(target=run, args=(f"q{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    assert len(encoder.calls) == 1
+    for query, embedding in results.items():
+        np.testing.assert_array_equal(embedding, StubEncoder().encode([query])[0])
+
+
+def test_query_batcher_fails_batch_on_row_count_mismatch():
+    batcher = QueryBatcher(lambda queries: np.zeros((0, 4)), 0, max_batch=4)
+
+    with pytest.raises(RuntimeError, match="0 embeddings for 1 queries"):
+        batcher.encode("orders")
+    batcher.close()
+
+
+def test_query_batcher_close_stops_worker():
+    batcher = QueryBatcher(StubEncoder().encode, 0, max_batch=4)
+    batcher.encode("orders")
+    worker = batcher._worker
+    batcher.close()
+
+    assert worker is not None and not worker.is_alive()
+    with pytest.raises(RuntimeError, match="closed"):
+        batcher.encode("orders")
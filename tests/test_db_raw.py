@@ -1,18 +1,13 @@
 """Raw database connection test for Databricks."""
 
 import os
-from pathlib import Path
 
 import pytest
-from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
 
 
 @pytest.fixture(scope="module")
 def databricks_engine():
-    env_path = Path(__file__).parent / ".env"
-    load_dotenv(env_path)
-
     url = os.getenv("DATABASE_DATABRICKS_URL")
     if not url:
         pytest.skip("DATABASE_DATABRICKS_URL not set in tests/.env")
@@ -1,10 +1,8 @@
 import os
-from pathlib import Path
 import gc
 from typing import cast
 
 import pytest
-from dotenv import load_dotenv
 from sqlalchemy import create_engine
 import psutil
 
@@ -12,23 +10,8 @@ from schema_search import SchemaSearch
 from schema_search.types import SearchType
 
 
-@pytest.fixture(scope="module")
-def database_url():
-    env_path = Path(__file__).parent / ".env"
-    load_dotenv(env_path)
-
-    url = os.getenv("DATABASE_URL")
-    if not url:
-        pytest.skip("DATABASE_URL not set in tests/.env file")
-
-    return url
-
-
 @pytest.fixture(scope="module")
 def llm_config():
-    env_path = Path(__file__).parent / ".env"
-    load_dotenv(env_path)
-
     api_key = os.getenv("LLM_API_KEY")
     base_url = "https://api.anthropic.com/v1/"
 
@@ -93,10 +76,10 @@ def test_search_user_information(search_engine):
 
 def _calculate_score(results, correct_table):
     """Calculate score based on position. Top=5, 2nd=4, 3rd=3, 4th=2, 5th=1, not found=0"""
-    for position, result in enumerate(results[:5], 1):
-        if result["table"] == correct_table:
-            return 6 - position
-    return 0
+    top_tables = [result["table"] for result in results[:5]]
+    if correct_table not in top_tables:
+        return 0
+    return 5 - top_tables.index(correct_table)
 
 
 def _get_eval_data():
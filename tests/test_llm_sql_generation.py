@@ -1,33 +1,16 @@
 import os
-from pathlib import Path
 
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
 import anthropic
 import pytest
-from dotenv import load_dotenv
 from sqlalchemy import create_engine
 
 from schema_search import SchemaSearch
 
 
-@pytest.fixture(scope="module")
-def database_url():
-    env_path = Path(__file__).parent / ".env"
-    load_dotenv(env_path)
-
-    url = os.getenv("DATABASE_URL")
-    if not url:
-        pytest.skip("DATABASE_URL not set in tests/.env file")
-
-    return url
-
-
 @pytest.fixture(scope="module")
 def llm_config():
-    env_path = Path(__file__).parent / ".env"
-    load_dotenv(env_path)
-
     api_key = os.getenv("LLM_API_KEY")
     base_url = os.getenv("LLM_BASE_URL")
 
@@ -1,8 +1,6 @@
 import os
-from pathlib import Path
 
 import pytest
-from dotenv import load_dotenv
 from sqlalchemy import Engine, text
 
 from schema_search import SchemaSearch
@@ -11,9 +9,6 @@ from schema_search.utils.utils import create_engine_from_url
 
 @pytest.fixture(scope="module")
 def snowflake_url() -> str:
-    env_path = Path(__file__).parent / ".env"
-    load_dotenv(env_path)
-
     url = os.getenv("DATABASE_SNOWFLAKE_URL")
     if not url:
         pytest.skip("DATABASE_SNOWFLAKE_URL not set in tests/.env")